@@ -21,4 +21,7 @@ with open(".path/to/file.pak", "rb") as f:
     # Read a file
     content = reader.get("folder/example.uasset", stream)
     if content:
-        print(f"Content of folder/example.uasset: {content}")
\ No newline at end of file
+        print(f"Content of folder/example.uasset: {content}")
+    # Extract everything under a folder
+    for file_path, data in reader.extract_all("folder/", stream):
+        print(f"{file_path}: {len(data)} bytes")
@@ -7,7 +7,7 @@ with open(".path/to/file.pak", "wb") as f:
     # Create a builder with compression
     builder = PakBuilder()
     builder.key(b"YOUR_KEY")
-    builder.compression([Compression.ZLIB])
+    builder.compression([Compression.ZSTD])
     
     # Create a writer
     writer = builder.writer(stream, Version.V10)
@@ -1,33 +1,46 @@
+import array
+import hashlib
+import io
+import logging
 import os
 import sys
+import threading
 import ctypes
+from collections import OrderedDict
+from enum import IntEnum
 from cffi import FFI
 
 ffi = FFI()
 
-ffi.cdef("""
-    typedef enum {
-        NONE = 0,
-        ZLIB = 1,
-        ZSTD = 2,
-        OODLE = 3,
-    } Compression;
-
-    typedef enum {
-        V1 = 1,
-        V2 = 2,
-        V3 = 3,
-        V4 = 4,
-        V5 = 5,
-        V6 = 6,
-        V7 = 7,
-        V8A = 8,
-        V8B = 9
-        V9 = 10,
-        V10 = 11,
-        V11 = 12,
-    } Version;
+# Constants
+class Compression(IntEnum):
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+    OODLE = 3
+
+class Version(IntEnum):
+    V1 = 1
+    V2 = 2
+    V3 = 3
+    V4 = 4
+    V5 = 5
+    V6 = 6
+    V7 = 7
+    V8A = 8
+    V8B = 9
+    V9 = 10
+    V10 = 11
+    V11 = 12
+
+
+def _cdef_enum(enum):
+    """Render an IntEnum as a C typedef so cdef and Python share one definition"""
+    members = "".join(f"        {member.name} = {member.value},\n" for member in enum)
+    return f"    typedef enum {{\n{members}    }} {enum.__name__};\n"
+
 
+ffi.cdef(_cdef_enum(Compression) + _cdef_enum(Version) + """
     // Callback structure
     struct StreamCallbacks {
         void* context;
@@ -57,125 +70,219 @@ ffi.cdef("""
     int pak_writer_write_index(void* writer);
 """)
 
+_log = logging.getLogger(__name__)
+
 script_dir = os.path.dirname(os.path.abspath(__file__))
 lib_path = os.path.join(script_dir, 'repak_bind.dll')
+# CFFI releases the GIL for the duration of every call through lib, so long
+# reads/compression run concurrently with other Python threads; the stream
+# callbacks re-acquire it only while they run. Readers, writers and streams
+# each hold a lock around their native calls, so parallelism comes from
+# using separate objects per thread.
 lib = ffi.dlopen(lib_path)
 
+# FFI helpers bound once so hot paths skip the module attribute lookups
+_NULL = ffi.NULL
+_memmove = ffi.memmove
+_buffer = ffi.buffer
+_reader_get = lib.pak_reader_get
+_buffer_drop = lib.pak_buffer_drop
+
+# Buffer size used when wrapping unbuffered read-only file objects
+STREAM_BUFFER_SIZE = 65536
+
+
+class _BorrowedReader(io.BufferedReader):
+    """Buffered reader that leaves the caller's raw file open"""
+    def close(self):
+        pass
+
+
+def _buffered(fileobj):
+    """Wrap a read-only raw file object so small native reads are coalesced"""
+    if (isinstance(fileobj, io.RawIOBase)
+            and fileobj.readable() and not fileobj.writable()):
+        return _BorrowedReader(fileobj, STREAM_BUFFER_SIZE)
+    return fileobj
+
+
+# Number of pak files whose metadata (mount point, file list) is kept;
+# 0 disables the cache
+METADATA_CACHE_SIZE = 10
+
+_metadata_cache = OrderedDict()
+_metadata_lock = threading.Lock()
+
+
+def clear_metadata_cache():
+    """Forget the cached metadata of every pak file"""
+    with _metadata_lock:
+        _metadata_cache.clear()
+
+
+def _cached_metadata(fileobj, key_digest):
+    """
+    Return the shared metadata dict for an open pak file, or None if the
+    stream has no file descriptor or the cache is disabled. Entries are keyed
+    on the open file's device, inode, mtime and size plus the key, so a
+    replaced or rewritten pak never reuses stale metadata.
+    """
+    if METADATA_CACHE_SIZE <= 0:
+        return None
+    try:
+        st = os.fstat(fileobj.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    cache_key = (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size, key_digest)
+    with _metadata_lock:
+        metadata = _metadata_cache.pop(cache_key, None)
+        if metadata is None:
+            metadata = {}
+        _metadata_cache[cache_key] = metadata
+        while len(_metadata_cache) > METADATA_CACHE_SIZE:
+            _metadata_cache.popitem(last=False)
+    return metadata
+
+
+# Stream callbacks shared by every RepakStream; the owning stream is
+# recovered from the handle passed as the callback context
+@ffi.callback("intptr_t(void*, unsigned char*, size_t)")
+def _read_callback(ctx, buffer, length, _from_handle=ffi.from_handle):
+    return _from_handle(ctx)._read(buffer, length)
+
+
+@ffi.callback("intptr_t(void*, const unsigned char*, size_t)")
+def _write_callback(ctx, buffer, length, _from_handle=ffi.from_handle):
+    return _from_handle(ctx)._write(buffer, length)
+
+
+@ffi.callback("int64_t(void*, int64_t, int)")
+def _seek_callback(ctx, offset, whence, _from_handle=ffi.from_handle):
+    return _from_handle(ctx)._seek(offset, whence)
+
+
+@ffi.callback("int(void*)")
+def _flush_callback(ctx, _from_handle=ffi.from_handle):
+    return _from_handle(ctx)._flush()
+
+
 # Define Python wrapper classes
 class RepakStream:
     def __init__(self, fileobj=None):
         """
-        Create a stream from a file-like object or use in-memory buffer if fileobj is None
+        Create a stream from a file-like object or use in-memory buffer if fileobj is None.
+        Unbuffered (raw) read-only file objects are wrapped in a buffer of STREAM_BUFFER_SIZE bytes.
         """
-        self.fileobj = fileobj
+        self.fileobj = _buffered(fileobj)
         self.buffer = bytearray() if fileobj is None else None
         self.position = 0
+        # The native side seeks and reads through separate callbacks, so a
+        # stream must only be driven by one native call at a time
+        self._lock = threading.Lock()
         
-        @ffi.callback("intptr_t(void*, unsigned char*, size_t)")
-        def read_callback(ctx, buffer, length):
-            try:
-                if self.fileobj:
-                    data = self.fileobj.read(length)
-                    if not data:
-                        return 0
-                    ffi.memmove(buffer, data, len(data))
-                    return len(data)
-                else:
-                    # In-memory read
-                    remaining = len(self.buffer) - self.position
-                    to_read = min(remaining, length)
-                    if to_read <= 0:
-                        return 0
-                    ffi.memmove(buffer, self.buffer[self.position:self.position+to_read], to_read)
-                    self.position += to_read
-                    return to_read
-            except Exception as e:
-                print(f"Read error: {e}")
-                return -1
-                
-        @ffi.callback("intptr_t(void*, const unsigned char*, size_t)")
-        def write_callback(ctx, buffer, length):
-            try:
-                data = bytes(ffi.buffer(buffer, length))
-                if self.fileobj:
-                    bytes_written = self.fileobj.write(data)
-                    return bytes_written
-                else:
-                    # In-memory write
-                    if self.position == len(self.buffer):
-                        # Append to the end
-                        self.buffer.extend(data)
-                    else:
-                        # Overwrite existing bytes and potentially extend
-                        self.buffer[self.position:self.position+len(data)] = data
-                        if self.position + len(data) > len(self.buffer):
-                            self.buffer.extend(data[-(self.position + len(data) - len(self.buffer)):])
-                    self.position += len(data)
-                    return len(data)
-            except Exception as e:
-                print(f"Write error: {e}")
-                return -1
-                
-        @ffi.callback("int64_t(void*, int64_t, int)")
-        def seek_callback(ctx, offset, whence):
-            try:
-                if self.fileobj:
-                    if whence == 0:  # SEEK_SET
-                        self.fileobj.seek(offset)
-                    elif whence == 1:  # SEEK_CUR
-                        self.fileobj.seek(offset, 1)
-                    elif whence == 2:  # SEEK_END
-                        self.fileobj.seek(offset, 2)
-                    return self.fileobj.tell()
-                else:
-                    # In-memory seek
-                    if whence == 0:  # SEEK_SET
-                        new_pos = offset
-                    elif whence == 1:  # SEEK_CUR
-                        new_pos = self.position + offset
-                    elif whence == 2:  # SEEK_END
-                        new_pos = len(self.buffer) + offset
-                    else:
-                        return -1
-                    
-                    if new_pos < 0:
-                        return -1
-                    
-                    # If seeking beyond the end, extend the buffer
-                    if new_pos > len(self.buffer):
-                        self.buffer.extend(b'\0' * (new_pos - len(self.buffer)))
-                    
-                    self.position = new_pos
-                    return self.position
-            except Exception as e:
-                print(f"Seek error: {e}")
-                return -1
-                
-        @ffi.callback("int(void*)")
-        def flush_callback(ctx):
-            try:
-                if self.fileobj and hasattr(self.fileobj, 'flush'):
-                    self.fileobj.flush()
-                return 0
-            except Exception as e:
-                print(f"Flush error: {e}")
-                return -1
-                
-        # Keep references to callbacks to prevent garbage collection
-        self._read_cb = read_callback
-        self._write_cb = write_callback
-        self._seek_cb = seek_callback
-        self._flush_cb = flush_callback
+        # Keep the handle alive for as long as the native side may call back
+        self._handle = ffi.new_handle(self)
         
         # Create the C structure
         self.callbacks = ffi.new("struct StreamCallbacks *", {
-            "context": ffi.NULL,
-            "read": self._read_cb,
-            "write": self._write_cb,
-            "seek": self._seek_cb,
-            "flush": self._flush_cb
+            "context": self._handle,
+            "read": _read_callback,
+            "write": _write_callback,
+            "seek": _seek_callback,
+            "flush": _flush_callback
         })
 
+    def _read(self, buffer, length):
+        try:
+            if self.fileobj:
+                data = self.fileobj.read(length)
+                if not data:
+                    return 0
+                _memmove(buffer, data, len(data))
+                return len(data)
+            else:
+                # In-memory read
+                remaining = len(self.buffer) - self.position
+                to_read = min(remaining, length)
+                if to_read <= 0:
+                    return 0
+                # Release both views on exit so the buffer can be resized later
+                start = self.position
+                with memoryview(self.buffer) as view, view[start:start + to_read] as chunk:
+                    _memmove(buffer, chunk, to_read)
+                self.position += to_read
+                return to_read
+        except Exception as e:
+            _log.error("Read error: %s", e)
+            return -1
+
+    def _write(self, buffer, length):
+        try:
+            data = _buffer(buffer, length)
+            if self.fileobj:
+                # The native memory is only valid during this call, so only
+                # io streams (which never keep the object) get it borrowed
+                if not isinstance(self.fileobj, (io.BufferedIOBase, io.RawIOBase)):
+                    data = data[:]
+                bytes_written = self.fileobj.write(data)
+                return bytes_written
+            else:
+                # In-memory write
+                end = self.position + length
+                if end > len(self.buffer):
+                    # Grow to fit, then overwrite in place
+                    self.buffer.extend(b'\0' * (end - len(self.buffer)))
+                with memoryview(self.buffer) as view:
+                    view[self.position:end] = data
+                self.position = end
+                return length
+        except Exception as e:
+            _log.error("Write error: %s", e)
+            return -1
+
+    def _seek(self, offset, whence):
+        try:
+            if self.fileobj:
+                if whence == 0:  # SEEK_SET
+                    self.fileobj.seek(offset)
+                elif whence == 1:  # SEEK_CUR
+                    self.fileobj.seek(offset, 1)
+                elif whence == 2:  # SEEK_END
+                    self.fileobj.seek(offset, 2)
+                return self.fileobj.tell()
+            else:
+                # In-memory seek
+                if whence == 0:  # SEEK_SET
+                    new_pos = offset
+                elif whence == 1:  # SEEK_CUR
+                    new_pos = self.position + offset
+                elif whence == 2:  # SEEK_END
+                    new_pos = len(self.buffer) + offset
+                else:
+                    return -1
+                
+                if new_pos < 0:
+                    return -1
+                
+                # If seeking beyond the end, extend the buffer
+                if new_pos > len(self.buffer):
+                    self.buffer.extend(b'\0' * (new_pos - len(self.buffer)))
+                
+                self.position = new_pos
+                return self.position
+        except Exception as e:
+            _log.error("Seek error: %s", e)
+            return -1
+
+    def _flush(self):
+        try:
+            if self.fileobj and hasattr(self.fileobj, 'flush'):
+                self.fileobj.flush()
+            return 0
+        except Exception as e:
+            _log.error("Flush error: %s", e)
+            return -1
+
     def get_callbacks(self):
         return self.callbacks[0]
         
@@ -189,35 +296,45 @@ class RepakStream:
 class PakBuilder:
     def __init__(self):
         self.builder = lib.pak_builder_new()
-        if self.builder == ffi.NULL:
+        if self.builder == _NULL:
             raise RuntimeError("Failed to create PakBuilder")
+        self._key_digest = None
     
     def __del__(self):
-        if hasattr(self, 'builder') and self.builder != ffi.NULL:
+        if hasattr(self, 'builder') and self.builder != _NULL:
             lib.pak_builder_drop(self.builder)
-            self.builder = ffi.NULL
+            self.builder = _NULL
     
     def key(self, key_bytes):
         """Set encryption key"""
         if len(key_bytes) != 32:
             raise ValueError("Key must be exactly 32 bytes")
         key_array = ffi.new("unsigned char[32]")
-        for i, b in enumerate(key_bytes):
-            key_array[i] = b
+        _memmove(key_array, bytes(key_bytes), 32)
         
         new_builder = lib.pak_builder_key(self.builder, ffi.cast("const unsigned char (*)[32]", key_array))
-        if new_builder == ffi.NULL:
+        if new_builder == _NULL:
             raise RuntimeError("Failed to set key")
         
         # Update our builder pointer and prevent old one from being freed
         self.builder = new_builder
+        self._key_digest = hashlib.sha256(bytes(key_bytes)).digest()
         return self
     
-    def compression(self, compression_list):
-        """Set compression methods"""
-        compressions = ffi.new("Compression[]", compression_list)
+    def compression(self, compression_list=None):
+        """
+        Set compression methods from a list of Compression values or an array.array('i').
+        Defaults to ZSTD, which compresses and decompresses faster than ZLIB at a similar ratio.
+        """
+        if compression_list is None:
+            compression_list = [Compression.ZSTD]
+        if not (isinstance(compression_list, array.array)
+                and compression_list.typecode in ('i', 'I', 'l', 'L')
+                and compression_list.itemsize == ffi.sizeof("Compression")):
+            compression_list = array.array('i', compression_list)
+        compressions = ffi.from_buffer("Compression[]", compression_list)
         new_builder = lib.pak_builder_compression(self.builder, compressions, len(compression_list))
-        if new_builder == ffi.NULL:
+        if new_builder == _NULL:
             raise RuntimeError("Failed to set compression")
         
         # Update our builder pointer and prevent old one from being freed
@@ -226,13 +343,14 @@ class PakBuilder:
     
     def reader(self, stream):
         """Create a PakReader from a stream"""
-        reader_ptr = lib.pak_builder_reader(self.builder, stream.get_callbacks())
-        if reader_ptr == ffi.NULL:
+        with stream._lock:
+            reader_ptr = lib.pak_builder_reader(self.builder, stream.get_callbacks())
+        if reader_ptr == _NULL:
             raise RuntimeError("Failed to create reader")
         
         # Create a PakReader and transfer ownership
-        reader = PakReader(reader_ptr)
-        self.builder = ffi.NULL  # Builder is consumed
+        reader = PakReader(reader_ptr, _cached_metadata(stream.fileobj, self._key_digest))
+        self.builder = _NULL  # Builder is consumed
         return reader
     
     def writer(self, stream, version=12, mount_point="../../../", path_hash_seed=0):
@@ -245,23 +363,31 @@ class PakBuilder:
             c_mount_point, 
             path_hash_seed
         )
-        if writer_ptr == ffi.NULL:
+        if writer_ptr == _NULL:
             raise RuntimeError("Failed to create writer")
         
         # Create a PakWriter and transfer ownership
         writer = PakWriter(writer_ptr)
-        self.builder = ffi.NULL  # Builder is consumed
+        self.builder = _NULL  # Builder is consumed
         return writer
 
 
 class PakReader:
-    def __init__(self, reader_ptr=None):
+    def __init__(self, reader_ptr=None, metadata=None):
         self.reader = reader_ptr
+        # Mount point and file list, shared between readers of the same pak
+        self._metadata = {} if metadata is None else metadata
+        # Output slots for pak_reader_get, reused across get() calls
+        self._buf_out = ffi.new("unsigned char**")
+        self._len_out = ffi.new("size_t*")
+        # The GIL is released during native calls; nothing guarantees the
+        # native reader may be entered twice, so reads are serialized
+        self._lock = threading.Lock()
     
     def __del__(self):
-        if hasattr(self, 'reader') and self.reader != ffi.NULL:
+        if hasattr(self, 'reader') and self.reader != _NULL:
             lib.pak_reader_drop(self.reader)
-            self.reader = ffi.NULL
+            self.reader = _NULL
     
     @property
     def version(self):
@@ -271,62 +397,142 @@ class PakReader:
     @property
     def mount_point(self) -> str:
         """Get pak file mount point"""
-        c_str = lib.pak_reader_mount_point(self.reader)
-        result = ffi.string(c_str).decode('utf-8')
-        lib.pak_cstring_drop(c_str)
-        return result
+        mount_point = self._metadata.get('mount_point')
+        if mount_point is None:
+            c_str = lib.pak_reader_mount_point(self.reader)
+            mount_point = ffi.string(c_str).decode('utf-8')
+            lib.pak_cstring_drop(c_str)
+            self._metadata['mount_point'] = mount_point
+        return mount_point
     
-    def get(self, path, stream=None):
-        """Get file content by path"""
+    def _get_buffer(self, path, stream):
+        """Fetch a file into a native buffer; the caller must drop it"""
         if stream is None:
             stream = RepakStream()
         
         # If the path doesn't start with the mount point, add it first
         
-        c_path = ffi.new("char[]", path.encode('utf-8'))
-        buffer_ptr = ffi.new("unsigned char**")
-        length_ptr = ffi.new("size_t*")
- 
+        # CFFI passes bytes to a char* argument without copying
+        c_path = path.encode('utf-8')
         
-        # Add debug output
-        print(f"Requesting file: {path}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Requesting file: %s", path)
+        
+        with self._lock, stream._lock:
+            buffer_ptr = self._buf_out
+            length_ptr = self._len_out
+            buffer_ptr[0] = _NULL
+            length_ptr[0] = 0
+            result = _reader_get(self.reader, c_path, stream.get_callbacks(), buffer_ptr, length_ptr)
+            buffer, length = buffer_ptr[0], length_ptr[0]
         
-        result = lib.pak_reader_get(self.reader, c_path, stream.get_callbacks(), buffer_ptr, length_ptr)
         if result != 0:
-            print(f"Failed to get file")
+            _log.warning("Failed to get file: %s", path)
             return None
         
         # Check if the buffer is NULL
-        if buffer_ptr[0] == ffi.NULL:
-            print("pak_reader_get returned NULL buffer")
+        if buffer == _NULL:
+            _log.warning("pak_reader_get returned NULL buffer")
+            return None
+        
+        return buffer, length
+
+    def get(self, path, stream=None):
+        """
+        Get file content by path.
+        Calls on one reader are serialized; use one reader per thread to read in parallel.
+        """
+        native = self._get_buffer(path, stream)
+        if native is None:
             return None
         
         # Copy the data and free the original buffer
-        data = bytes(ffi.buffer(buffer_ptr[0], length_ptr[0]))
-        lib.pak_buffer_drop(buffer_ptr[0], length_ptr[0])
+        buffer, length = native
+        data = _buffer(buffer, length)[:]
+        _buffer_drop(buffer, length)
         return data
 
+    def get_into(self, path, out, stream=None):
+        """
+        Read file content by path directly into a writable buffer.
+        A bytearray is resized to fit (growing it may reallocate, so reuse one
+        that is already large enough); other buffers must be large enough.
+        Calls are serialized per reader, as with get().
+        Returns the number of bytes written, or None if the file could not be read.
+        """
+        native = self._get_buffer(path, stream)
+        if native is None:
+            return None
+        
+        buffer, length = native
+        try:
+            if isinstance(out, bytearray) and len(out) < length:
+                # Fill what fits, then append the tail straight from native memory
+                head = len(out)
+                _memmove(out, buffer, head)
+                out[head:] = _buffer(buffer + head, length - head)
+            else:
+                if isinstance(out, bytearray):
+                    del out[length:]
+                elif len(out) < length:
+                    raise ValueError(f"Buffer too small: need {length} bytes, got {len(out)}")
+                _memmove(out, buffer, length)
+        finally:
+            _buffer_drop(buffer, length)
+        return length
+
+    def extract_all(self, prefix="", stream=None):
+        """
+        Yield (path, data) for every file whose path starts with prefix.
+        Raises RuntimeError if an entry cannot be read, so the result is never partial.
+        Each read is serialized per reader, as with get().
+        """
+        for path in self.files():
+            if not path.startswith(prefix):
+                continue
+            data = self.get(path, stream)
+            if data is None:
+                raise RuntimeError(f"Failed to read {path}")
+            yield path, data
+
+    def __contains__(self, path):
+        """Check whether a file exists in the pak"""
+        fileset = self._metadata.get('fileset')
+        if fileset is None:
+            self.files()
+            fileset = self._metadata.get('fileset', ())
+        return path in fileset
+
     # Change 2: Enhance debugging for files() method
     def files(self):
-        """Get list of files in the pak"""
+        """Get the files in the pak as a tuple; fetched once, then cached"""
+        cached = self._metadata.get('files')
+        if cached is not None:
+            return cached
+        
         length_ptr = ffi.new("size_t*")
         files_ptr = lib.pak_reader_files(self.reader, length_ptr)
         
-        if files_ptr == ffi.NULL:
-            print("pak_reader_files returned NULL")
-            return []
+        if files_ptr == _NULL:
+            _log.warning("pak_reader_files returned NULL")
+            return ()
         
         files = []
+        append = files.append
+        string = ffi.string
+        null = _NULL
         for i in range(length_ptr[0]):
             c_str = files_ptr[i]
-            if c_str == ffi.NULL:
-                print(f"Warning: NULL string at index {i}")
+            if c_str == null:
+                _log.warning("NULL string at index %d", i)
                 continue
-            file_path = ffi.string(c_str).decode('utf-8')
-            files.append(file_path)
+            append(string(c_str).decode('utf-8'))
         
         # Free the file list
         lib.pak_drop_files(files_ptr, length_ptr[0])
+        files = tuple(files)
+        self._metadata['fileset'] = frozenset(files)
+        self._metadata['files'] = files
         return files
 
 
@@ -334,48 +540,37 @@ class PakReader:
 class PakWriter:
     def __init__(self, writer_ptr):
         self.writer = writer_ptr
+        # The GIL is released during native calls, so serialize access to
+        # the writer when several threads feed it
+        self._lock = threading.Lock()
     
     def __del__(self):
-        if hasattr(self, 'writer') and self.writer != ffi.NULL:
+        if hasattr(self, 'writer') and self.writer != _NULL:
             lib.pak_writer_drop(self.writer)
-            self.writer = ffi.NULL
+            self.writer = _NULL
     
     def write_file(self, path, data):
         """Write a file to the pak"""
-        c_path = ffi.new("char[]", path.encode('utf-8'))
-        buffer = ffi.new("unsigned char[]", data)
+        # CFFI passes bytes to a char* argument without copying
+        c_path = path.encode('utf-8')
+        try:
+            # Borrow the caller's memory instead of copying it
+            buffer = ffi.from_buffer("unsigned char[]", data)
+        except (TypeError, BufferError):
+            # Non-contiguous buffers and plain sequences still need one copy
+            buffer = ffi.from_buffer("unsigned char[]", bytes(data))
         
-        result = lib.pak_writer_write_file(self.writer, c_path, buffer, len(data))
+        with self._lock:
+            result = lib.pak_writer_write_file(self.writer, c_path, buffer, len(buffer))
         if result != 0:
             raise RuntimeError(f"Failed to write file: {path}")
         return True
     
     def write_index(self):
         """Write the pak index"""
-        result = lib.pak_writer_write_index(self.writer)
-        if result != 0:
-            raise RuntimeError("Failed to write index")
-        self.writer = ffi.NULL  # Writer is consumed after write_index
+        with self._lock:
+            result = lib.pak_writer_write_index(self.writer)
+            if result != 0:
+                raise RuntimeError("Failed to write index")
+            self.writer = _NULL  # Writer is consumed after write_index
         return True
-
-
-# Constants
-class Compression:
-    NONE = 0
-    ZLIB = 1
-    ZSTD = 2
-    OODLE = 3
-
-class Version:
-    V1 = 1
-    V2 = 2
-    V3 = 3
-    V4 = 4
-    V5 = 5
-    V6 = 6
-    V7 = 7
-    V8A = 8
-    V8B = 9
-    V9 = 10
-    V10 = 11
-    V11 = 12
\ No newline at end of file